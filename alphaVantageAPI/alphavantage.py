@@ -3,13 +3,19 @@ import json
 import os
 import requests
 
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from importlib.util import find_spec
 from pathlib import Path, PurePath
 from pprint import pprint
+from re import compile as re_compile
 from re import sub as re_sub
 from sys import exit as sys_exit
+from threading import Lock
 from time import sleep as tsleep
+from types import MappingProxyType
 
 from pandas import DataFrame, DatetimeIndex
 
@@ -18,11 +24,32 @@ from .validate import _validate
 
 
 Ymd_format = "%Y-%m-%d"
+
+# Column name simplification patterns, e.g. "5. adjusted close" -> "adj_close"
+_COL_PREFIX_RE = re_compile(r'\d+\w?\. ')
+_COL_AMOUNT_RE = re_compile(r' amount')
+_COL_ADJ_RE = re_compile(r'adjusted')
+_COL_SPACE_RE = re_compile(r' ')
+
+# Matches AlphaVantage error payloads, e.g. {"Note": "Thank you for using Alpha Vantage! ..."}
+_AV_ERROR_RE = re_compile(rb'\s*\{\s*"(Note|Error Message|Information)"\s*:')
+
 excel = find_spec("openpyxl") is not None
 if excel is not None:
     try: import openpyxl
     except ImportError: pass
 
+# Prefer pandas' bundled ujson decoder; it parses bytes directly. precise_float
+# keeps floats identical to the stdlib json decoder.
+try:
+    from pandas.io.json import ujson_loads
+    _loads = partial(ujson_loads, precise_float=True)
+except ImportError:
+    try:
+        from pandas.io.json import loads
+        _loads = partial(loads, precise_float=True)
+    except ImportError: from json import loads as _loads
+
 
 # Missing API Key Message
 MISSING_API_KEY = """
@@ -35,6 +62,60 @@ OR
 Set your environment variable AV_API_KEY to your AV API key
 """
 
+
+_ApiBundle = namedtuple("_ApiBundle", [
+    "api", "series", "api_series", "api_function", "api_function_inv",
+    "api_datatype", "api_horizon", "api_listing_state", "api_outputsize",
+    "api_series_interval", "api_slice", "indicators", "api_indicator",
+    "api_indicator_matype", "api_required", "api_optional", "api_series_interval_int"
+])
+
+
+def _freeze(value):
+    """Recursively converts dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=4)
+def _load_api_cached(path_str:str) -> _ApiBundle:
+    """Load and post-process the API json file once per path. The result is
+    shared by every AlphaVantage instance, so it is frozen all the way down."""
+    api = _freeze(_loads(Path(path_str).read_bytes()))
+
+    api_series, api_function, api_function_inv = [], {}, {}
+    for x in api["series"]:
+        alias, function = x["alias"], x["function"]
+        api_series.append(function)
+        api_function[alias] = function
+        api_function_inv[function] = alias
+    api_required = {x["function"]: x["required"] for x in api["series"] + api["indicator"] if "required" in x}
+    api_optional = {x["function"]: x["optional"] for x in api["series"] + api["indicator"] if "optional" in x}
+
+    return _ApiBundle(
+        api=api,
+        series=api["series"],
+        api_series=tuple(api_series),
+        api_function=MappingProxyType(api_function),
+        api_function_inv=MappingProxyType(api_function_inv),
+        api_datatype=api["datatype"],
+        api_horizon=api["horizon"],
+        api_listing_state=api["listing_state"],
+        api_outputsize=api["outputsize"],
+        api_series_interval=api["series_interval"],
+        api_slice=api["slice"],
+        indicators=api["indicator"],
+        api_indicator=tuple(x["function"] for x in api["indicator"]),
+        api_indicator_matype=api["matype"],
+        api_required=MappingProxyType(api_required),
+        api_optional=MappingProxyType(api_optional),
+        api_series_interval_int=MappingProxyType({int(x[:-3]): x for x in api["series_interval"]})
+    )
+
+
 class AlphaVantage(object):
     """AlphaVantage Class
 
@@ -53,7 +134,9 @@ class AlphaVantage(object):
     output: str = "csv"
     clean: bool = False
     proxy: dict = dict()
-    
+    max_workers: int = 5
+    history_size: int or None = 1024
+
     Examples
     --------
     >>> from alphaVantageAPI.alphavantage import AlphaVantage
@@ -63,6 +146,31 @@ class AlphaVantage(object):
     END_POINT = "https://www.alphavantage.co/query"
     DEBUG = False
 
+    # function: (parameters, alias) -> export filename
+    _PATH_BUILDERS = {
+        "CURRENCY_EXCHANGE_RATE": lambda p, a: f"{p['from_currency']}{p['to_currency']}",
+        "FX_DAILY": lambda p, a: f"{p['from_symbol']}{p['to_symbol']}_{a.replace('FX', '')}",
+        "FX_MONTHLY": lambda p, a: f"{p['from_symbol']}{p['to_symbol']}_{a.replace('FX', '')}",
+        "FX_WEEKLY": lambda p, a: f"{p['from_symbol']}{p['to_symbol']}_{a.replace('FX', '')}",
+        "FX_INTRADAY": lambda p, a: f"{p['from_symbol']}{p['to_symbol']}_{p['interval']}",
+        "DIGITAL_CURRENCY_DAILY": lambda p, a: f"{p['symbol']}{p['market']}_{a.replace('C', '')}",
+        "DIGITAL_CURRENCY_WEEKLY": lambda p, a: f"{p['symbol']}{p['market']}_{a.replace('C', '')}",
+        "DIGITAL_CURRENCY_MONTHLY": lambda p, a: f"{p['symbol']}{p['market']}_{a.replace('C', '')}",
+        "OVERVIEW": lambda p, a: f"{p['symbol']}",
+        "SYMBOL_SEARCH": lambda p, a: f"SEARCH_{p['keywords']}",
+        "CRYPTO_RATING": lambda p, a: f"{p['symbol']}_RATING",
+    }
+
+    # output: (df, path, parameters) -> None
+    _WRITERS = {
+        "csv": lambda df, path, p: df.to_csv(path),
+        "json": lambda df, path, p: df.to_json(path),
+        "pkl": lambda df, path, p: df.to_pickle(path),
+        "html": lambda df, path, p: df.to_html(path),
+        "txt": lambda df, path, p: Path(path).write_text(df.to_string()),
+        "xlsx": lambda df, path, p: df.to_excel(path, sheet_name=p["function"]),
+    }
+
     def __init__(self,
             api_key:str = None,
             premium:bool = False,
@@ -72,13 +180,18 @@ class AlphaVantage(object):
             datatype:str = "json",
             output_size:str = "compact",
             clean:bool = False,
-            proxy:dict = {}
+            proxy:dict = {},
+            max_workers:int = 5,
+            history_size:int = 1024
         ) -> None:
 
         # Load API json file        
         api_file = Path(PurePath(__file__).parent / "data/api.json")
         self._load_api(api_file)
-        
+
+        # Reuse TCP/TLS connections across calls, pool sized by max_workers
+        self._requests_session = requests.Session()
+
         # Initialize Class properties
         self.api_key     = api_key
         self.premium     = premium
@@ -90,10 +203,12 @@ class AlphaVantage(object):
         self.output_size = output_size
         self.proxy       = proxy
         self.clean       = clean
+        self.max_workers = max_workers
 
-        self._requests_session = requests.session()
-        self._response_history = []
+        self._response_history = deque()
+        self.history_size = history_size
         self._api_call_count = 0
+        self._throttle_lock = Lock()
 
 
     # Private Methods
@@ -110,65 +225,65 @@ class AlphaVantage(object):
     def _load_api(self, api_file:Path) -> None:
         """Load API from a JSON file."""
         if api_file.exists():
-            with api_file.open("r") as content:
-                api = json.load(content)
-            content.close()
+            bundle = _load_api_cached(str(api_file.resolve()))
 
-            self.__api = api
-            self._api_lists()
+            self.__api = bundle.api
+            self._api_lists(bundle)
         else:
             raise ValueError(f"{api_file} does not exist.")
 
 
-    def _api_lists(self) -> None:
+    def _api_lists(self, bundle:_ApiBundle) -> None:
         """Initialize lists based on API."""
-        self.series = [x for x in self.__api["series"]]
-        self.__api_series = [x["function"] for x in self.series]
-        self.__api_function = {x["alias"]: x["function"] for x in self.__api["series"]}
-        self.__api_function_inv = {v: k for k, v in self.__api_function.items()}
-        self.__api_datatype = self.__api["datatype"]
-        self.__api_horizon = self.__api["horizon"]
-        self.__api_listing_state = self.__api["listing_state"]
-        self.__api_outputsize = self.__api["outputsize"]
-        self.__api_series_interval = self.__api["series_interval"]
-        self.__api_slice = self.__api["slice"]
-
-        self.indicators = [x for x in self.__api["indicator"]]
-        self.__api_indicator = [x["function"] for x in self.indicators]
-        self.__api_indicator_matype = self.__api["matype"]
+        self.series = list(bundle.series)
+        self.__api_series = bundle.api_series
+        self.__api_function = bundle.api_function
+        self.__api_function_inv = bundle.api_function_inv
+        self.__api_datatype = bundle.api_datatype
+        self.__api_horizon = bundle.api_horizon
+        self.__api_listing_state = bundle.api_listing_state
+        self.__api_outputsize = bundle.api_outputsize
+        self.__api_series_interval = bundle.api_series_interval
+        self.__api_series_interval_int = bundle.api_series_interval_int
+        self.__api_slice = bundle.api_slice
+
+        self.indicators = list(bundle.indicators)
+        self.__api_indicator = bundle.api_indicator
+        self.__api_indicator_matype = bundle.api_indicator_matype
+        self.__api_required = bundle.api_required
+        self.__api_optional = bundle.api_optional
 
 
     def _function_alias(self, function:str) -> str:
         """Returns the function alias for the given "function."""
-        return self.__api_function_inv[function] if function in self.__api_function_inv else function
+        return self.__api_function_inv.get(function, function)
 
 
     def _parameters(self, function:str, kind:str) -> list:
         """Returns 'required' or 'optional' parameters for a 'function'."""
-        result = []
-        if kind in ["required", "optional"]:
-            try:
-                all_functions = self.series + self.indicators
-                result = [x[kind] for x in all_functions if kind in x and function == x["function"]].pop()
-            except IndexError:
-                pass
-        return result
+        if kind == "required":
+            return list(self.__api_required.get(function, []))
+        elif kind == "optional":
+            return list(self.__api_optional.get(function, []))
+        return []
 
 
     def _av_api_call(self, parameters:dict, timeout:int = 60, **kwargs) -> DataFrame or json or None:
         """Main method to handle AlphaVantage API call request and response."""
-        proxies = kwargs["proxies"] if "proxies" in kwargs else self.proxy
+        proxies = kwargs.get("proxies", self.proxy)
 
         # Everything is ok so far, add the AV API Key
         parameters["apikey"] = self.api_key
 
-        if not self.premium and self._api_call_count > 0:
-            tsleep(15.0001)
+        # Held while sleeping and claiming the call so concurrent calls are spaced out
+        with self._throttle_lock:
+            if not self.premium and self._api_call_count > 0:
+                tsleep(15.0001)
+            self._api_call_count += 1
 
         # Ready to Go. Format and get request response
         try:
-            # response =  self._requests_session.get(
-            response =  requests.get(  # Use till self._requests_session can be mocked in unittests
+            response = self._requests_session.get(
                 AlphaVantage.END_POINT,
                 params = parameters,
                 timeout = timeout,
@@ -176,57 +291,62 @@ class AlphaVantage(object):
             )
         except requests.exceptions.RequestException as ex:
             print(f"[X] response.get() exception: {ex}\n    parameters: {parameters}")
-            pass
-        finally:
-            response.close()
+            return None
+        response.close()
 
         if response.status_code != 200:
             print(f"[X] Request Failed: {response.status_code}.\nText:\n{response.text}\n{parameters['function']}")
+            return None
 
-        # If 'json' datatype, return as 'json'. Otherwise return text response for 'csv'
-        if self.datatype == "json":
-            response = response.json()
-        else:
-            response = response.text
+        # AlphaVantage reports errors and throttling as a 200 with a json message
+        raw = response.content
+        if _AV_ERROR_RE.match(raw) is not None:
+            print(f"[X] Request Failed: {parameters['function']}\n{_loads(raw)}")
+            return None
 
         self._response_history.append(parameters)
         # **Underdevelopment**
         # self._response_history.append({"last": time.localtime(), "parameters": parameters})
-        if self.datatype == "json":
-            response = self._to_dataframe(parameters["function"], response)
-        else:
-            _TSIE = "TIME_SERIES_INTRADAY_EXTENDED"
-            _csv_functions = ["EARNINGS_CALENDAR", "IPO_CALENDAR", "LISTING_STATUS", _TSIE]
-            if parameters["function"] in _csv_functions:
-                response = response.replace("\r", "")
-                response = DataFrame(
-                    [x.split(",") for x in response.split("\n")[1:]],
-                    columns=[x for x in response.split("\n")[0].split(",")]
-                )
-                response = response.mask(response.eq("None")).dropna()
-            
-            if parameters["function"] == _TSIE:
-                response = response.iloc[::-1]
-                response.set_index(DatetimeIndex(response["time"]), inplace=True)
-                response.drop(["time"], axis=1, inplace=True)
-                response.index.name = "datetime"
-
-        if self._api_call_count < 1:
-            self._api_call_count += 1
+        return self.__parse(parameters, raw)
+
+
+    def _parse_json(self, parameters:dict, raw:bytes) -> DataFrame or list:
+        """Parses a 'json' datatype response into DataFrame(s)."""
+        return self._to_dataframe(parameters["function"], _loads(raw), parameters=parameters)
+
+
+    def _parse_csv(self, parameters:dict, raw:bytes) -> DataFrame or str:
+        """Parses a 'csv' datatype response. Unsupported functions return the text."""
+        function = parameters["function"]
+        _TSIE = "TIME_SERIES_INTRADAY_EXTENDED"
+        _csv_functions = ["EARNINGS_CALENDAR", "IPO_CALENDAR", "LISTING_STATUS", _TSIE]
+
+        response = raw.decode("utf-8", errors="replace")
+        if function in _csv_functions:
+            response = response.replace("\r", "")
+            response = DataFrame(
+                [x.split(",") for x in response.split("\n")[1:]],
+                columns=[x for x in response.split("\n")[0].split(",")]
+            )
+            response = response.mask(response.eq("None")).dropna()
+
+        if function == _TSIE:
+            response.set_index(DatetimeIndex(response["time"]), inplace=True)
+            response.drop(["time"], axis=1, inplace=True)
+            response.index.name = "datetime"
+            response.sort_index(inplace=True)
 
         return response
 
 
-    def _to_dataframe(self, function:str, response:dict) -> DataFrame:
+    def _to_dataframe(self, function:str, response:dict, parameters:dict = None) -> DataFrame:
         """Converts json response into a Pandas DataFrame given a 'function'"""
-        try:
-            json_keys = response.keys()
-            key = [x for x in json_keys if not x.startswith("Meta Data")].pop()
-        except IndexError:
+        key = next((x for x in response if not x.startswith("Meta Data")), None)
+        if key is None:
             print(f" [X] Download failed.  Check the AV documentation for correct parameters: https://www.alphavantage.co/documentation/")
             sys_exit(1)
 
-        reports = None
+        reports, time_series = None, False
         if function == "CRYPTO_RATING":
             df = DataFrame.from_dict(response, orient="index")
         elif function == "GLOBAL_QUOTE":
@@ -263,19 +383,22 @@ class AlphaVantage(object):
 
             reports = [quarterlydf, annuallydf]
         else:
-            # Otherwise it is a time-series, also calls df = df.iloc[::-1] below
-            df = DataFrame.from_dict(response[key], dtype=float).T
+            # Otherwise it is a time-series, built row-wise and sorted ascending by date
+            df = DataFrame.from_dict(response[key], orient="index", dtype=float)
             df.index.rename("date", inplace=True)
+            df.sort_index(inplace=True)
+            time_series = True
 
         # Handle Reports / Search / GC /
         if reports is not None and len(reports) > 0:
             if self.export:
-                self._save_df(function, reports[0], report_freq="Quarterly")
-                self._save_df(function, reports[1], report_freq="Annually")
+                self._save_df(function, reports[0], parameters, report_freq="Quarterly")
+                self._save_df(function, reports[1], parameters, report_freq="Annually")
             return reports
         else:
             if function != "SYMBOL_SEARCH":
-                df = df.iloc[::-1]
+                if not time_series:
+                    df = df.iloc[::-1]
                 df.reset_index(inplace=True)
 
             if self.clean:
@@ -297,7 +420,7 @@ class AlphaVantage(object):
                     df.set_index("item", inplace=True)
 
             if self.export:
-                self._save_df(function, df)
+                self._save_df(function, df, parameters)
 
         return df
 
@@ -309,98 +432,70 @@ class AlphaVantage(object):
         elif function == "OVERVIEW":
             column_names = ["item", "value"]
         elif function in ["CRYPTO_RATING", "GLOBAL_QUOTE"]:
-            column_names = [re_sub(r'\d+(|\w). ', "", name) for name in df.columns]
+            column_names = [_COL_PREFIX_RE.sub("", name) for name in df.columns]
         elif function == "SYMBOL_SEARCH":
             column_names = ["symbol", "name", "type", "region", "market_open", "market_close", "tz", "currency", "match"]
         else:
-            column_names = [re_sub(r'\d+(|\w). ', "", name) for name in df.columns]
-            column_names = [re_sub(r' amount', "", name) for name in column_names]
-            column_names = [re_sub(r'adjusted', "adj", name) for name in column_names]
-            column_names = [re_sub(r' ', "_", name) for name in column_names]
+            column_names = [
+                _COL_SPACE_RE.sub("_", _COL_ADJ_RE.sub("adj", _COL_AMOUNT_RE.sub("", _COL_PREFIX_RE.sub("", name))))
+                for name in df.columns
+            ]
 
         df.columns = column_names
         return df
 
 
-    def _save_df(self, function:str, df:DataFrame, **kwargs) -> None:
+    def _save_df(self, function:str, df:DataFrame, parameters:dict = None, **kwargs) -> None:
         """Save Pandas DataFrame to a file type given a 'function'."""
         # Get the alias for the 'function' so filenames are short
         short_function = self._function_alias(function)
 
-        # Get the 'parameters' from the last AV api call since it was successful
-        parameters = self.last()
+        # Default to the 'parameters' from the last AV api call since it was successful
+        if parameters is None:
+            parameters = self.last()
 
         dt_now = datetime.now().strftime(Ymd_format)
 
         report_freq = kwargs.pop("report_freq", None)
         # Determine Path
-        if function == "CURRENCY_EXCHANGE_RATE": # ok
-            path = f"{self.export_path}/{parameters['from_currency']}{parameters['to_currency']}"
-        elif function in ["FXD", "FXM", "FXW", "FX_DAILY", "FX_MONTHLY", "FX_WEEKLY"]:
-            path = f"{self.export_path}/{parameters['from_symbol']}{parameters['to_symbol']}_{short_function.replace('FX', '')}"
-        elif function in ["FXI", "FX_INTRADAY"]:
-            path = f"{self.export_path}/{parameters['from_symbol']}{parameters['to_symbol']}_{parameters['interval']}"
-        elif function in ["CD", "CW", "CM", "DIGITAL_CURRENCY_DAILY", "DIGITAL_CURRENCY_WEEKLY", "DIGITAL_CURRENCY_MONTHLY"]:
-            path = f"{self.export_path}/{parameters['symbol']}{parameters['market']}_{short_function.replace('C', '')}"
+        builder = self._PATH_BUILDERS.get(function)
+        if builder is not None:
+            filename = builder(parameters, short_function)
+        elif function in ["INCOME_STATEMENT", "BALANCE_SHEET", "CASH_FLOW"]:
+            if not isinstance(report_freq, str):
+                raise ValueError(f"report_freq is required to export {function}")
+            filename = f"{parameters['symbol']}_{short_function}_{report_freq}"
         elif function == "TIME_SERIES_INTRADAY_EXTENDED":
             ie_slice = re_sub(r'month', "M",  re_sub(r'year', "Y", parameters['slice']))
             ie_adjusted = "_ADJ" if parameters['adjusted'] == "true" else ""
-            path = f"{self.export_path}/{parameters['symbol']}_{short_function}_{parameters['interval']}_{ie_slice}{ie_adjusted}"
-        elif function == "OVERVIEW": #
-            path = f"{self.export_path}/{parameters['symbol']}"
-        elif function == "SYMBOL_SEARCH": #
-            path = f"{self.export_path}/SEARCH_{parameters['keywords']}"
-        elif function == "INCOME_STATEMENT": #
-            if isinstance(report_freq, str):
-                path = f"{self.export_path}/{parameters['symbol']}_IS_{report_freq}"
-        elif function == "BALANCE_SHEET": #
-            if isinstance(report_freq, str):
-                path = f"{self.export_path}/{parameters['symbol']}_BS_{report_freq}"
-        elif function == "CASH_FLOW": #
-            if isinstance(report_freq, str):
-                path = f"{self.export_path}/{parameters['symbol']}_CF_{report_freq}"
-        elif function == "CRYPTO_RATING": #
-            path = f"{self.export_path}/{parameters['symbol']}_RATING"
-        elif function == "TIME_SERIES_INTRADAY": #
+            filename = f"{parameters['symbol']}_{short_function}_{parameters['interval']}_{ie_slice}{ie_adjusted}"
+        elif function == "TIME_SERIES_INTRADAY":
             i_adjusted = "_ADJ" if parameters['adjusted'] == "true" else ""
-            path = f"{self.export_path}/{parameters['symbol']}_{parameters['interval']}{i_adjusted}"
-        elif short_function.startswith("C") and len(short_function) == 2:
-            path = f"{self.export_path}/{parameters['symbol']}{parameters['market']}"
+            filename = f"{parameters['symbol']}_{parameters['interval']}{i_adjusted}"
         elif function in self.__api_indicator:
-            path = f"{self.export_path}/{parameters['symbol']}_{parameters['interval'][0].upper()}_{short_function}"
+            filename = f"{parameters['symbol']}_{parameters['interval'][0].upper()}_{short_function}"
             if "series_type" in parameters:
-                path += f"_{parameters['series_type'][0].upper()}"
+                filename += f"_{parameters['series_type'][0].upper()}"
             if "time_period" in parameters:
-                path += f"_{parameters['time_period']}"
+                filename += f"_{parameters['time_period']}"
         elif function == "EARNINGS_CALENDAR":
             if "symbol" in parameters:
-                path = f"{self.export_path}/EARNINGS_{parameters['symbol']}_{parameters['horizon'].upper()}_{dt_now}"
+                filename = f"EARNINGS_{parameters['symbol']}_{parameters['horizon'].upper()}_{dt_now}"
             else:
-                path = f"{self.export_path}/EARNINGS_{parameters['horizon'].upper()}_{dt_now}"
+                filename = f"EARNINGS_{parameters['horizon'].upper()}_{dt_now}"
         elif function == "IPO_CALENDAR":
-            path = f"{self.export_path}/IPOS_{dt_now}"
+            filename = f"IPOS_{dt_now}"
         elif function == "LISTING_STATUS":
             _state = "" if parameters["state"] == "active" else "DE"
-            path = f"{self.export_path}/{_state}LISTED_{dt_now}"
+            filename = f"{_state}LISTED_{dt_now}"
             if "date" in parameters and parameters["date"] is not None:
-                path += f"_FOR_{parameters['date']}"
+                filename += f"_FOR_{parameters['date']}"
         else:
-            path = f"{self.export_path}/{parameters['symbol']}_{short_function}"
-        path += f".{self.output}"
+            filename = f"{parameters['symbol']}_{short_function}"
+        path = f"{self.export_path}/{filename}.{self.output}"
 
         # Export desired format
-        if self.output == "csv":
-            df.to_csv(path)
-        elif self.output == "json":
-            df.to_json(path)
-        elif self.output == "pkl":
-            df.to_pickle(path)
-        elif self.output == "html":
-            df.to_html(path)
-        elif self.output == "txt":
-            Path(path).write_text(df.to_string())
-        elif excel and self.output == "xlsx":
-            df.to_excel(path, sheet_name = parameters["function"])
+        self._WRITERS[self.output](df, path, parameters)
 
 
     # Public Methods
@@ -421,8 +516,8 @@ class AlphaVantage(object):
         if interval is not None:
             if isinstance(interval, str) and interval in self.__api_series_interval:
                 parameters["interval"] = interval
-            elif isinstance(interval, int) and interval in [int(re_sub(r'min', "", x)) for x in self.__api_series_interval]:
-                parameters["interval"] = f"{interval}min"
+            elif isinstance(interval, int) and interval in self.__api_series_interval_int:
+                parameters["interval"] = self.__api_series_interval_int[interval]
             else:
                 return None
 
@@ -436,9 +531,7 @@ class AlphaVantage(object):
                 parameters[required] = kwargs[required]
 
         optional_parameters = self._parameters(parameters["function"], "optional")
-        for option in optional_parameters:
-            if option in kwargs:
-                _validate(self.__api_indicator_matype, option, parameters, **kwargs)
+        _validate(self.__api_indicator_matype, optional_parameters, parameters, **kwargs)
 
         download = self._av_api_call(parameters, **kwargs)
         return download if download is not None else None
@@ -507,8 +600,8 @@ class AlphaVantage(object):
         
         if isinstance(interval, str) and interval in self.__api_series_interval:
             parameters["interval"] = interval
-        elif isinstance(interval, int) and interval in [int(re_sub(r'min', "", x)) for x in self.__api_series_interval]:
-            parameters["interval"] = f"{interval}min"
+        elif isinstance(interval, int) and interval in self.__api_series_interval_int:
+            parameters["interval"] = self.__api_series_interval_int[interval]
         else:
             return None
 
@@ -526,8 +619,8 @@ class AlphaVantage(object):
 
         if isinstance(interval, str) and interval in self.__api_series_interval:
             parameters["interval"] = interval
-        elif isinstance(interval, int) and interval in [int(re_sub(r'min', "", x)) for x in self.__api_series_interval]:
-            parameters["interval"] = f"{interval}min"
+        elif isinstance(interval, int) and interval in self.__api_series_interval_int:
+            parameters["interval"] = self.__api_series_interval_int[interval]
         else:
             return None
 
@@ -537,8 +630,8 @@ class AlphaVantage(object):
         self.datatype = "csv" # Returns csv by default
         download = self._av_api_call(parameters, **kwargs)
 
-        if self.export:
-            self._save_df(parameters["function"], download)
+        if self.export and download is not None:
+            self._save_df(parameters["function"], download, parameters)
         return download if download is not None else None
 
 
@@ -557,11 +650,12 @@ class AlphaVantage(object):
 
         self.datatype = "csv" # Returns csv by default
         download = self._av_api_call(parameters, **kwargs)
+        if download is None: return None
         download.set_index(index, inplace=True)
         download.sort_index(axis=0, ascending=ascending, inplace=True)
 
         if self.export:
-            self._save_df(parameters["function"], download)
+            self._save_df(parameters["function"], download, parameters)
         return download if download is not None else None
 
 
@@ -573,11 +667,12 @@ class AlphaVantage(object):
 
         self.datatype = "csv"
         download = self._av_api_call(parameters, **kwargs) # returns DataFrame
+        if download is None: return None
         download.set_index(index, inplace=True)
         download.sort_index(axis=0, ascending=ascending, inplace=True)
 
         if self.export:
-            self._save_df(parameters["function"], download)
+            self._save_df(parameters["function"], download, parameters)
         return download if download is not None else None
 
 
@@ -597,11 +692,12 @@ class AlphaVantage(object):
 
         self.datatype = "csv" # Returns csv by default
         download = self._av_api_call(parameters, **kwargs)
+        if download is None: return None
         download.set_index(index, inplace=True)
         download.sort_index(axis=0, ascending=ascending, inplace=True)
 
         if self.export:
-            self._save_df(parameters["function"], download)
+            self._save_df(parameters["function"], download, parameters)
         return download if download is not None else None
 
     # Company Information
@@ -638,13 +734,14 @@ class AlphaVantage(object):
         if isinstance(symbol, str):
             symbol = symbol.upper()
 
-        # TODO: Refactor for multithreading
-        # Process a symbol list and return a list of DataFrames
+        # Process a symbol list and return a dict of DataFrames
         if isinstance(symbol, list) and len(symbol) > 1:
             # Create list: symbols, with all elements Uppercase from the list: symbol
             symbols = list(map(str.upper, symbol))
-            # Call self.data for each ticker in the list: symbols
-            return {ticker: self.data(ticker, function, **kwargs) for ticker in symbols}
+            # Call self.data for each ticker in the list: symbols, sharing the pooled session
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                downloads = executor.map(lambda ticker: self.data(ticker, function, **kwargs), symbols)
+                return dict(zip(symbols, downloads))
 
         try:
             function = self.__api_function[function] if function not in self.__api_indicator else function
@@ -665,9 +762,7 @@ class AlphaVantage(object):
                 parameters[required] = kwargs[required]
 
         optional_parameters = self._parameters(parameters["function"], "optional")
-        for option in optional_parameters:
-            if option in kwargs:
-                _validate(self.__api_indicator_matype, option, parameters, **kwargs)
+        _validate(self.__api_indicator_matype, optional_parameters, parameters, **kwargs)
 
         download = self._av_api_call(parameters, **kwargs)
         return download if download is not None else None
@@ -678,7 +773,7 @@ class AlphaVantage(object):
         """Simple help system to print 'required' or 'optional' parameters based on a keyword."""
         def _functions(): print(f"   Functions:\n    {', '.join(self.__api_series)}")
         def _indicators(): print(f"  Indicators:\n    {', '.join(self.__api_indicator)}")
-        def _aliases(): pprint(self.__api_function, indent=4)
+        def _aliases(): pprint(dict(self.__api_function), indent=4)
 
         if keyword is None:
             print(f"{AlphaVantage.__name__} Help: Input a function name for more infomation on 'required'\nAvailable Functions:\n")
@@ -702,13 +797,18 @@ class AlphaVantage(object):
 
 
     def call_history(self) -> list:
-        """Returns a history of successful response calls."""
-        return self._response_history
+        """Returns a history of the most recent 'history_size' successful response calls."""
+        return list(self._response_history)
 
 
     def last(self, n:int = 1) -> str:
         """Returns the last \'n\' calls as a list."""
-        return (self.call_history())[-n] if n > 0 else []
+        return self._response_history[-n] if n > 0 else []
+
+
+    def close(self) -> None:
+        """Closes the underlying requests Session and its pooled connections."""
+        self._requests_session.close()
 
 
     # Class Properties
@@ -798,6 +898,7 @@ class AlphaVantage(object):
             self.__datatype = value.lower()
         else:
             self.__datatype = self.__api_datatype[0]
+        self.__parse = self._parse_json if self.__datatype == "json" else self._parse_csv
 
 
     @property
@@ -836,6 +937,46 @@ class AlphaVantage(object):
             self.__premium = False
 
 
+    @property
+    def max_workers(self) -> int:
+        return self.__max_workers
+
+    @max_workers.setter
+    def max_workers(self, value:int) -> None:
+        if value is not None and isinstance(value, int) and not isinstance(value, bool) and value > 0:
+            self.__max_workers = value
+        else:
+            self.__max_workers = 5
+
+        # One pooled connection per worker thread; release the replaced pool's sockets
+        replaced = self._requests_session.get_adapter("https://")
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=self.__max_workers)
+        self._requests_session.mount("https://", adapter)
+        replaced.close()
+
+
+    @property
+    def history_size(self) -> int:
+        return self.__history_size
+
+    @history_size.setter
+    def history_size(self, value:int) -> None:
+        # None keeps an unbounded history
+        if value is None or (isinstance(value, int) and not isinstance(value, bool) and value > 0):
+            self.__history_size = value
+        else:
+            self.__history_size = 1024
+        self._response_history = deque(self._response_history, maxlen=self.__history_size)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
     def __repr__(self) -> str:
         s  = f"{AlphaVantage.API_NAME}(\n  end_point:str = {AlphaVantage.END_POINT},\n"
         s += f"  api_key:str = {self.api_key},\n  export:bool = {self.export},\n"
@@ -1,8 +1,9 @@
 from alphaVantageAPI.alphavantage import AlphaVantage
 
+from time import sleep
 from unittest import TestCase
 from unittest.mock import patch
-from pandas import DataFrame, read_csv
+from pandas import DataFrame, DatetimeIndex, read_csv
 
 from .utils import Path
 from .utils import Constant as C
@@ -68,6 +69,10 @@ class TestAlphaVantageAPI(TestCase):
         cls.csv_intra_ext_adj_slice = read_csv(cls.test_data_path / "mock_intra_ext_adj_15min_y1m2.csv")
         cls.csv_intra_ext_raw_slice = read_csv(cls.test_data_path / "mock_intra_ext_raw_60min_y1m3.csv")
 
+        cls.text_intra_ext_adj = (cls.test_data_path / "mock_intra_ext_adj_15min_y1m1.csv").read_text()
+        cls.text_intra_ext_adj_slice = (cls.test_data_path / "mock_intra_ext_adj_15min_y1m2.csv").read_text()
+        cls.text_intra_ext_raw_slice = (cls.test_data_path / "mock_intra_ext_raw_60min_y1m3.csv").read_text()
+
         # Pandas DataFrames of sample data
         cls.df_fx = av._to_dataframe("CURRENCY_EXCHANGE_RATE", cls.json_fx)
         cls.df_fx_daily = av._to_dataframe("FX_DAILY", cls.json_fx_daily)
@@ -161,6 +166,10 @@ class TestAlphaVantageAPI(TestCase):
         del cls.csv_intra_ext_adj_slice
         del cls.csv_intra_ext_raw_slice
 
+        del cls.text_intra_ext_adj
+        del cls.text_intra_ext_adj_slice
+        del cls.text_intra_ext_raw_slice
+
 
     def setUp(self):
         self.av = AlphaVantage(api_key=C.API_KEY_TEST)
@@ -186,6 +195,59 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(self.av.digital(C.API_DIGITAL_TEST), DataFrame)
         self.assertIsInstance(self.av.digital(C.API_DIGITAL_TEST), dict)
         
+    @patch("alphaVantageAPI.alphavantage.AlphaVantage._av_api_call")
+    def test_data_symbol_list(self, mock_av_api_call):
+        mock_av_api_call.return_value = self.df_data
+        symbols = ["msft", "aapl", "ibm"]
+
+        result = self.av.data(symbols, "DA")
+
+        self.assertEqual(mock_av_api_call.call_count, len(symbols))
+        self.assertIsInstance(result, dict)
+        self.assertEqual(list(result.keys()), ["MSFT", "AAPL", "IBM"])
+        self.assertIsInstance(result["MSFT"], DataFrame)
+
+    @patch("alphaVantageAPI.alphavantage.AlphaVantage._av_api_call")
+    def test_intraday_interval(self, mock_av_api_call):
+        mock_av_api_call.return_value = self.df_data
+
+        self.assertIsInstance(self.av.intraday(C.API_DATA_TEST, interval=15), DataFrame)
+        self.assertEqual(mock_av_api_call.call_args[0][0]["interval"], "15min")
+
+        self.assertIsInstance(self.av.intraday(C.API_DATA_TEST, interval="60min"), DataFrame)
+        self.assertEqual(mock_av_api_call.call_args[0][0]["interval"], "60min")
+
+        self.assertIsNone(self.av.intraday(C.API_DATA_TEST, interval=7))
+        self.assertEqual(mock_av_api_call.call_count, 2)
+
+    @patch("alphaVantageAPI.alphavantage.tsleep")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
+    def test_data_symbol_list_throttled(self, mock_requests_get, mock_tsleep):
+        def _slow_response(*args, **kwargs):
+            sleep(0.05) # Keep the first request in flight while other workers start
+            return _mock_response(json_data=self.json_data)
+        mock_requests_get.side_effect = _slow_response
+        symbols = ["AAPL", "AMZN", "GOOG", "IBM", "MSFT", "TSLA"]
+
+        result = self.av.data(symbols, "DA")
+
+        self.assertEqual(len(result), len(symbols))
+        self.assertEqual(mock_requests_get.call_count, len(symbols))
+        self.assertEqual(mock_tsleep.call_count, len(symbols) - 1)
+
+
+    @patch("alphaVantageAPI.alphavantage.DataFrame.to_csv")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
+    def test_data_symbol_list_export(self, mock_requests_get, mock_to_csv):
+        mock_requests_get.side_effect = lambda *args, **kwargs: _mock_response(json_data=self.json_data)
+        symbols = ["AAPL", "AMZN", "GOOG", "IBM", "MSFT"]
+        av = AlphaVantage(api_key=C.API_KEY_TEST, premium=True, export=True, export_path="/tmp/av_test")
+
+        av.data(symbols, "D")
+
+        paths = sorted(Path(x.args[0]).name for x in mock_to_csv.call_args_list)
+        self.assertEqual(paths, [f"{symbol}_D.csv" for symbol in symbols])
+
     # @patch("alphaVantageAPI.alphavantage.AlphaVantage._av_api_call")
     # def test_intraday(self, mock_av_api_call):
     #     mock_av_api_call.side_effect = [None, self.df_sectors, self.json_sectors]
@@ -203,7 +265,7 @@ class TestAlphaVantageAPI(TestCase):
 
     # av_api_call tests
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_fx(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_fx)
         mock_to_dataframe.return_value = self.df_fx
@@ -215,7 +277,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe(), DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_fx_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -225,10 +287,10 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_fx_daily(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_fx_daily)
         mock_to_dataframe.return_value = self.df_fx_daily
@@ -240,7 +302,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe(), DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_fx_daily_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -250,10 +312,10 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_fx_intraday(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_fx_intraday)
         mock_to_dataframe.return_value = self.df_fx
@@ -265,7 +327,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe(), DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_fx_intraday_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -275,10 +337,10 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_fx_monthly(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_fx_monthly)
         mock_to_dataframe.return_value = self.df_fx_monthly
@@ -290,7 +352,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe(), DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_fx_monthly_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -300,10 +362,10 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_fx_weekly(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_fx_weekly)
         mock_to_dataframe.return_value = self.df_fx_weekly
@@ -315,7 +377,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe(), DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_fx_weekly_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -325,10 +387,10 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_data(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_data)
         mock_to_dataframe.return_value = self.df_data
@@ -340,7 +402,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe(), DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_data_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
         mock_requests_get.return_value = _mock_response(text_data=self.json_data)
@@ -349,11 +411,11 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_intraday(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_data)
         mock_to_dataframe.return_value = self.df_data
@@ -365,7 +427,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe(), DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_intraday_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -375,54 +437,81 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
+
+
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
+    def test_csv_invalid_utf8(self, mock_requests_get):
+        self.av.datatype = "csv"
+
+        mock_requests_get.return_value = _mock_response(text_data="symbol,name\nNESN,Nestl\xe9\n")
+        mock_requests_get.return_value.content = "symbol,name\nNESN,Nestl\xe9\n".encode("latin-1")
+
+        av_api_call = self.av._av_api_call(self.intraday_parameters)
+
+        self.assertEqual(av_api_call, "symbol,name\nNESN,Nestl�\n")
 
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_intraday_ext_adj_csv(self, mock_requests_get, mock_to_dataframe):
-        mock_requests_get.return_value = _mock_response(text_data=self.csv_intra_ext_adj)
-        mock_to_dataframe.return_value = self.df_intraday_ext_adj
+        self.av.datatype = "csv"
+        mock_requests_get.return_value = _mock_response(text_data=self.text_intra_ext_adj)
 
         av_api_call = self.av._av_api_call(self.intraday_ext_parameters)
 
         self.assertEqual(mock_requests_get.call_count, 1)
-        self.assertEqual(mock_to_dataframe.call_count, 1)
-        self.assertIsInstance(mock_to_dataframe(), DataFrame)
+        self.assertEqual(mock_to_dataframe.call_count, 0)
+        self.assertIsInstance(av_api_call, DataFrame)
+        self.assertIsInstance(av_api_call.index, DatetimeIndex)
+        self.assertEqual(av_api_call.index.name, "datetime")
+        self.assertTrue(av_api_call.index.is_monotonic_increasing)
+        self.assertEqual(len(av_api_call), len(self.csv_intra_ext_adj))
+        self.assertEqual(list(av_api_call.columns), ["open", "high", "low", "close", "volume"])
 
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_intraday_ext_adj_slice_csv(self, mock_requests_get, mock_to_dataframe):
-        mock_requests_get.return_value = _mock_response(text_data=self.csv_intra_ext_adj_slice)
-        mock_to_dataframe.return_value = self.df_intraday_ext_adj_slice
+        self.av.datatype = "csv"
+        mock_requests_get.return_value = _mock_response(text_data=self.text_intra_ext_adj_slice)
 
         _params = self.intraday_ext_parameters.copy()
         _params.update({"interval": 15, "slice": "year1month2"})
         av_api_call = self.av._av_api_call(_params)
 
         self.assertEqual(mock_requests_get.call_count, 1)
-        self.assertEqual(mock_to_dataframe.call_count, 1)
-        self.assertIsInstance(mock_to_dataframe(), DataFrame)
+        self.assertEqual(mock_to_dataframe.call_count, 0)
+        self.assertIsInstance(av_api_call, DataFrame)
+        self.assertIsInstance(av_api_call.index, DatetimeIndex)
+        self.assertEqual(av_api_call.index.name, "datetime")
+        self.assertTrue(av_api_call.index.is_monotonic_increasing)
+        self.assertEqual(len(av_api_call), len(self.csv_intra_ext_adj_slice))
+        self.assertEqual(list(av_api_call.columns), ["open", "high", "low", "close", "volume"])
 
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_intraday_ext_raw_slice_csv(self, mock_requests_get, mock_to_dataframe):
-        mock_requests_get.return_value = _mock_response(text_data=self.csv_intra_ext_raw_slice)
-        mock_to_dataframe.return_value = self.df_intraday_ext_raw_slice
+        self.av.datatype = "csv"
+        mock_requests_get.return_value = _mock_response(text_data=self.text_intra_ext_raw_slice)
 
         _params = self.intraday_ext_parameters.copy()
         _params.update({"interval": 60, "slice": "year1month3", "adjusted": False})
         av_api_call = self.av._av_api_call(_params)
 
         self.assertEqual(mock_requests_get.call_count, 1)
-        self.assertEqual(mock_to_dataframe.call_count, 1)
-        self.assertIsInstance(mock_to_dataframe(), DataFrame)
+        self.assertEqual(mock_to_dataframe.call_count, 0)
+        self.assertIsInstance(av_api_call, DataFrame)
+        self.assertIsInstance(av_api_call.index, DatetimeIndex)
+        self.assertEqual(av_api_call.index.name, "datetime")
+        self.assertTrue(av_api_call.index.is_monotonic_increasing)
+        self.assertEqual(len(av_api_call), len(self.csv_intra_ext_raw_slice))
+        self.assertEqual(list(av_api_call.columns), ["open", "high", "low", "close", "volume"])
 
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_indicator(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_indicator)
         mock_to_dataframe.return_value = self.df_indicator
@@ -434,7 +523,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe(), DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_indicator_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -444,11 +533,11 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_digital(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_digital)
         mock_to_dataframe.return_value = self.df_digital
@@ -460,7 +549,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe(), DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_digital_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -470,11 +559,11 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
 # 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_digital_rating(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_digital_rating)
         mock_to_dataframe.return_value = self.df_digital_rating
@@ -486,7 +575,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe(), DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_digital_rating_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -496,11 +585,11 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_global_quote(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_global_quote)
         mock_to_dataframe.return_value = self.df_global_quote
@@ -512,7 +601,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe(), DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_global_quote_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -522,11 +611,11 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_overview(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_overview)
         mock_to_dataframe.return_value = self.df_overview
@@ -538,7 +627,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe(), DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_overview_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -548,11 +637,11 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_overview(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_overview)
         mock_to_dataframe.return_value = self.df_overview
@@ -564,7 +653,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe(), DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_overview_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -574,11 +663,11 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_balance_sheet(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_balance)
         mock_to_dataframe.return_value = self.df_balance
@@ -593,7 +682,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe()[1], DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_balance_sheet_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -603,11 +692,11 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_income_statement(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_income)
         mock_to_dataframe.return_value = self.df_income
@@ -622,7 +711,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe()[1], DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_income_statement_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -632,11 +721,11 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
 
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_cashflow(self, mock_requests_get, mock_to_dataframe):
         mock_requests_get.return_value = _mock_response(json_data=self.json_cashflow)
         mock_to_dataframe.return_value = self.df_cashflow
@@ -651,7 +740,7 @@ class TestAlphaVantageAPI(TestCase):
         self.assertIsInstance(mock_to_dataframe()[1], DataFrame)
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
-    @patch("alphaVantageAPI.alphavantage.requests.get")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
     def test_cashflow_csv(self, mock_requests_get, mock_to_dataframe):
         self.av.datatype = "csv"
 
@@ -661,10 +750,52 @@ class TestAlphaVantageAPI(TestCase):
 
         self.assertEqual(mock_requests_get.call_count, 1)
         self.assertEqual(mock_to_dataframe.call_count, 0)
-        self.assertIsInstance(av_api_call(), dict)
+        self.assertEqual(av_api_call, mock_requests_get.return_value.text)
+
+
+    @patch("alphaVantageAPI.alphavantage.AlphaVantage._to_dataframe")
+    @patch("alphaVantageAPI.alphavantage.requests.Session.get")
+    def test_error_response(self, mock_requests_get, mock_to_dataframe):
+        self.av.premium = True
+        mock_requests_get.side_effect = [
+            _mock_response(status=500, json_data=self.json_data),
+            _mock_response(json_data={"Note": "Thank you for using Alpha Vantage!"}),
+            _mock_response(json_data={"Error Message": "Invalid API call."}),
+        ]
+
+        self.assertIsNone(self.av._av_api_call(self.data_parameters))
+        self.assertIsNone(self.av._av_api_call(self.data_parameters))
+        self.assertIsNone(self.av._av_api_call(self.data_parameters))
+
+        self.assertEqual(mock_requests_get.call_count, 3)
+        self.assertEqual(mock_to_dataframe.call_count, 0)
+        self.assertEqual(self.av.call_history(), [])
 
 
     # save_df tests
+    @patch("alphaVantageAPI.alphavantage.DataFrame.to_csv")
+    def test_save_df_filename(self, mock_to_csv):
+        self.av.output = "csv"
+        cases = [
+            (self.fx_parameters, "USDJPY.csv"),
+            ({"function": "FX_DAILY", "from_symbol": "EUR", "to_symbol": "USD"}, "EURUSD_D.csv"),
+            ({"function": "DIGITAL_CURRENCY_DAILY", "symbol": "BTC", "market": "CNY"}, "BTCCNY_D.csv"),
+            (self.indicator_parameters, "MSFT_W_RSI_O_10.csv"),
+            ({"function": "TIME_SERIES_INTRADAY_EXTENDED", "symbol": "MSFT", "interval": "15min", "slice": "year1month2", "adjusted": "true"}, "MSFT_IE_15min_Y1M2_ADJ.csv"),
+            (self.data_parameters, "MSFT_DA.csv"),
+        ]
+
+        for parameters, filename in cases:
+            self.av._save_df(parameters["function"], self.df_data, parameters)
+            self.assertEqual(Path(mock_to_csv.call_args[0][0]).name, filename)
+
+        income_parameters = {"function": "INCOME_STATEMENT", "symbol": C.API_FUNDA_TEST}
+        self.av._save_df(income_parameters["function"], self.df_data, income_parameters, report_freq="Annually")
+        self.assertEqual(Path(mock_to_csv.call_args[0][0]).name, f"{C.API_FUNDA_TEST}_IS_Annually.csv")
+
+        self.assertRaises(ValueError, self.av._save_df, income_parameters["function"], self.df_data, income_parameters)
+        self.assertEqual(mock_to_csv.call_count, len(cases) + 1)
+
     # @patch("alphaVantageAPI.alphavantage.AlphaVantage.last")
     # @patch("alphaVantageAPI.alphavantage.DataFrame.to_csv")
     # def test_save_df_to_csv(self, mock_to_csv, mock_last):
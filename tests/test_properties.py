@@ -1,4 +1,7 @@
-from alphaVantageAPI.alphavantage import AlphaVantage
+from alphaVantageAPI.alphavantage import AlphaVantage, _load_api_cached, _loads
+from alphaVantageAPI.validate import _validate
+
+import json
 
 from unittest import TestCase
 from unittest.mock import MagicMock
@@ -125,6 +128,46 @@ class TestAlphaVantageAPIProperties(TestCase):
         self.assertFalse(self.av.clean)
 
 
+    def test_max_workers_property(self):
+        self.av.max_workers = 8
+        self.assertEqual(self.av.max_workers, 8)
+
+        self.av.max_workers = 0
+        self.assertEqual(self.av.max_workers, 5)
+
+        self.av.max_workers = None
+        self.assertEqual(self.av.max_workers, 5)
+
+        self.av.max_workers = True
+        self.assertEqual(self.av.max_workers, 5)
+        self.assertNotIsInstance(self.av.max_workers, bool)
+
+        replaced = self.av._requests_session.get_adapter("https://www.alphavantage.co/query")
+        with patch.object(replaced, "close") as mock_close:
+            self.av.max_workers = 24
+        mock_close.assert_called_once()
+
+        adapter = self.av._requests_session.get_adapter("https://www.alphavantage.co/query")
+        self.assertEqual(adapter._pool_maxsize, 24)
+
+
+    def test_history_size_property(self):
+        self.av.history_size = 8
+        self.assertEqual(self.av.history_size, 8)
+        self.assertEqual(self.av._response_history.maxlen, 8)
+
+        self.av.history_size = None
+        self.assertIsNone(self.av.history_size)
+        self.assertIsNone(self.av._response_history.maxlen)
+
+        for invalid in [0, -1, "8", True]:
+            self.av.history_size = invalid
+            self.assertEqual(self.av.history_size, 1024)
+
+        av = AlphaVantage(api_key=self.API_KEY_TEST, history_size=-1)
+        self.assertEqual(av.history_size, 1024)
+
+
     def test_api_initial_parameters(self):
         self.assertIsInstance(self.av.api_key, str)
         self.assertEqual(self.av.api_key, self.API_KEY_TEST)
@@ -153,6 +196,12 @@ class TestAlphaVantageAPIProperties(TestCase):
         self.assertIsInstance(self.av.clean, bool)
         self.assertEqual(self.av.clean, False)
 
+        self.assertIsInstance(self.av.max_workers, int)
+        self.assertEqual(self.av.max_workers, 5)
+
+        self.assertIsInstance(self.av.history_size, int)
+        self.assertEqual(self.av.history_size, 1024)
+
 
     @patch("alphaVantageAPI.alphavantage.AlphaVantage.export_path")
     def test_init_export_path_method(self, mock_export_path):
@@ -162,6 +211,61 @@ class TestAlphaVantageAPIProperties(TestCase):
         self.assertRaises(PermissionError, mock_export_path)
         
 
+    @patch("alphaVantageAPI.alphavantage.requests.Session.close")
+    def test_context_manager(self, mock_session_close):
+        with AlphaVantage(api_key=self.API_KEY_TEST) as av:
+            self.assertIsInstance(av, AlphaVantage)
+        self.assertEqual(mock_session_close.call_count, 1)
+
+
+    def test_load_api_cached(self):
+        hits = _load_api_cached.cache_info().hits
+        av = AlphaVantage(api_key=self.API_KEY_TEST)
+
+        self.assertEqual(_load_api_cached.cache_info().hits, hits + 1)
+        self.assertIsInstance(av.series, list)
+        self.assertIsInstance(av.indicators, list)
+        self.assertIs(av.series[0], self.av.series[0])
+
+        with self.assertRaises(TypeError):
+            av._AlphaVantage__api_function["D"] = "QWERTY"
+        with self.assertRaises(TypeError):
+            av.series[0]["function"] = "QWERTY"
+
+        av._parameters("SMA", "required").append("qwerty")
+        self.assertNotIn("qwerty", self.av._parameters("SMA", "required"))
+
+
+    def test_loads_precise_float(self):
+        raw = b'{"a": [1.0000000000000002, 0.1, 123456.78901234567]}'
+        self.assertEqual(_loads(raw), json.loads(raw))
+
+
+    def test_call_history_method(self):
+        av = AlphaVantage(api_key=self.API_KEY_TEST, history_size=2)
+        for symbol in ["AAPL", "IBM", "MSFT"]:
+            av._response_history.append({"symbol": symbol})
+
+        self.assertIsInstance(av.call_history(), list)
+        self.assertEqual(av.call_history(), [{"symbol": "IBM"}, {"symbol": "MSFT"}])
+        self.assertEqual(av.last(), {"symbol": "MSFT"})
+
+
+    def test_validate(self):
+        matype = self.av._AlphaVantage__api_indicator_matype
+        options = ["matype", "nbdevup", "acceleration", "fastlimit", "slowlimit", "timeperiod1", "qwerty"]
+
+        parameters = _validate(matype, options, {"function": "MAMA"},
+            matype=-3, nbdevup=-2.5, acceleration="0.02", fastlimit=1.7, slowlimit=0.5, qwerty=1, fastperiod=12
+        )
+        self.assertEqual(parameters, {
+            "function": "MAMA", "matype": 3, "nbdevup": 2.5, "acceleration": 0.02, "slowlimit": 0.5
+        })
+
+        parameters = _validate(matype, ["matype", "fastmatype"], {}, matype=9, fastmatype=0)
+        self.assertEqual(parameters, {"fastmatype": 0})
+
+
     def test_parameters_method(self):
         self.assertIsInstance(self.av._parameters("TIME_SERIES_INTRADAY", "required"), list)
         self.assertIsInstance(self.av._parameters("TIME_SERIES_INTRADAY", "optional"), list)
@@ -29,7 +29,10 @@ def _mock_response(status=200, text_data=None, json_data=None, raise_for_status=
     
     mock_response.status_code = status
     if text_data is not None:
-        mock_response.text = mock.Mock(return_value=text_data)
-    elif json_data is not None:
+        text_data = text_data if isinstance(text_data, str) else json.dumps(text_data)
+        mock_response.text = text_data
+        mock_response.content = text_data.encode()
+    else:
         mock_response.json = mock.Mock(return_value=json_data)
+        mock_response.content = json.dumps(json_data if json_data is not None else {}).encode()
     return mock_response
\ No newline at end of file